@@ -9,16 +9,79 @@ and generates a report of shows/movies that haven't been watched in the past two
 import os
 import sys
 import json
-import time
 import re
+import heapq
 import datetime
 import asyncio
 import aiohttp
-import requests
 import argparse
-from typing import Dict, List, Any, Optional, Tuple
+from operator import itemgetter
+from typing import Dict, List, Any, Optional, Pattern, Tuple
 from configparser import ConfigParser
-from difflib import SequenceMatcher
+from functools import lru_cache
+from html import escape
+from xml.etree import ElementTree
+
+try:
+    import orjson  # Optional: much faster decoding of large API responses
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop  # Optional: libuv-based event loop, faster for many small requests
+except ImportError:
+    uvloop = None
+
+
+# Static stylesheet for the HTML report
+HTML_REPORT_STYLE = """    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        h1 { color: #333; }
+        table { border-collapse: collapse; width: 100%; margin-top: 20px; }
+        th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+        th { background-color: #f2f2f2; }
+        tr:nth-child(even) { background-color: #f9f9f9; }
+        tr:hover { background-color: #f5f5f5; }
+        .summary { margin-bottom: 20px; }
+    </style>"""
+
+# Rows requested per Tautulli get_history call
+TAUTULLI_HISTORY_PAGE_SIZE = 1000
+
+
+def _json_loads(body: bytes) -> Any:
+    """Decode a JSON response body, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+@lru_cache(maxsize=8)
+def _load_config(path: str, mtime: float) -> ConfigParser:
+    """
+    Parse the INI file at path; mtime is part of the cache key so edits are re-read.
+    The parser is shared between callers, so only read values from it.
+    """
+    config = ConfigParser()
+    config.read(path)
+    return config
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """Write data beside path and rename it into place so a crash never leaves a partial file."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _write_json(path: str, payload: Any) -> None:
+    """Write payload to path as indented JSON, preferring orjson when installed."""
+    if orjson is not None:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(payload, indent=2).encode("utf-8")
+    _write_atomic(path, data)
 
 
 class ServarrTautulliAnalyzer:
@@ -37,11 +100,13 @@ class ServarrTautulliAnalyzer:
             verbose: Enable verbose output
             debug: Enable debug output with API responses
         """
-        self.config = ConfigParser()
         self.verbose = verbose
         self.debug = debug
         self.session = None  # Will be initialized in async context
+        self._sem = None  # Caps in-flight requests, created with the session
         self.mode = "sonarr"  # Force sonarr mode for now
+        self._watched_cache: Dict[int, set] = {}  # months -> watched titles
+        self._libraries_cache: Optional[List[Dict[str, Any]]] = None
 
         if mode.lower() == "radarr":
             print(
@@ -58,40 +123,62 @@ class ServarrTautulliAnalyzer:
             print(f"Error: Config file {config_file} not found.")
             sys.exit(1)
 
-        self.config.read(config_file)
+        config = _load_config(config_file, os.path.getmtime(config_file))
 
         # Sonarr/Radarr configuration
         if self.mode == "sonarr":
-            self.servarr_url = self.config.get("sonarr", "url")
-            self.servarr_api_key = self.config.get("sonarr", "api_key")
+            self.servarr_url = config.get("sonarr", "url").rstrip("/")
+            self.servarr_api_key = config.get("sonarr", "api_key")
             self.item_count = None  # None means all series
             self.item_type = "series"
-            self.tautulli_library_name = self.config.get(
+            self.tautulli_library_name = config.get(
                 "tautulli", "tv_library_name", fallback="TV Shows"
             )
         else:  # radarr
-            self.servarr_url = self.config.get("radarr", "url")
-            self.servarr_api_key = self.config.get("radarr", "api_key")
+            self.servarr_url = config.get("radarr", "url").rstrip("/")
+            self.servarr_api_key = config.get("radarr", "api_key")
             self.item_count = None  # None means all movies
             self.item_type = "movie"
-            self.tautulli_library_name = self.config.get(
+            self.tautulli_library_name = config.get(
                 "tautulli", "movie_library_name", fallback="Films"
             )
 
         # Tautulli configuration
-        self.tautulli_url = self.config.get("tautulli", "url")
-        self.tautulli_api_key = self.config.get("tautulli", "api_key")
+        self.tautulli_url = config.get("tautulli", "url").rstrip("/")
+        self.tautulli_api_key = config.get("tautulli", "api_key")
+        self.title_aliases = self._parse_title_aliases(
+            config.get("tautulli", "aliases", raw=True, fallback="")
+        )
 
         # Plex configuration (still needed for some operations)
-        self.plex_url = self.config.get("plex", "url")
-        self.plex_token = self.config.get("plex", "token")
+        self.plex_url = config.get("plex", "url").rstrip("/")
+        self.plex_token = config.get("plex", "token")
 
         # Report configuration
-        self.report_path = self.config.get("report", "path", fallback="./report")
+        self.report_path = config.get("report", "path", fallback="./report")
 
         # Create report directory if it doesn't exist
         os.makedirs(self.report_path, exist_ok=True)
 
+    @staticmethod
+    def _parse_title_aliases(raw: str) -> Dict[str, set]:
+        """
+        Parse the multi-line 'aliases' option into {servarr title: {tautulli titles}}.
+
+        Each line is 'Servarr Title = Tautulli Title'; repeat a title to give it
+        several aliases. Everything is lowercased to match the watched set.
+        """
+        aliases: Dict[str, set] = {}
+        for line in raw.splitlines():
+            if not line.strip():
+                continue
+            source, sep, target = line.partition("=")
+            if not sep or not source.strip() or not target.strip():
+                print(f"Warning: ignoring malformed alias line '{line.strip()}'")
+                continue
+            aliases.setdefault(source.strip().lower(), set()).add(target.strip().lower())
+        return aliases
+
     async def get_items(self) -> List[Dict[str, Any]]:
         """Get all series/movies from Sonarr/Radarr."""
         await self.setup_session()
@@ -100,12 +187,12 @@ class ServarrTautulliAnalyzer:
         headers = {"X-Api-Key": self.servarr_api_key}
 
         try:
-            async with self.session.get(url, headers=headers) as response:
+            async with self._sem, self.session.get(url, headers=headers) as response:
                 response.raise_for_status()
-                data = await response.json()
+                data = _json_loads(await response.read())
                 return data
-        except aiohttp.ClientError as e:
-            print(f"Error connecting to {self.mode.capitalize()}: {e}")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Error connecting to {self.mode.capitalize()}: {e or type(e).__name__}")
             sys.exit(1)
 
     async def delete_item(self, item_id: int, delete_files: bool = False) -> bool:
@@ -117,7 +204,7 @@ class ServarrTautulliAnalyzer:
         params = {"deleteFiles": str(delete_files).lower()}
 
         try:
-            async with self.session.delete(
+            async with self._sem, self.session.delete(
                 url, headers=headers, params=params
             ) as response:
                 if response.status == 200:
@@ -125,29 +212,10 @@ class ServarrTautulliAnalyzer:
                 else:
                     print(f"Error deleting {self.item_type}: HTTP {response.status}")
                     return False
-        except aiohttp.ClientError as e:
-            print(f"Error deleting {self.item_type}: {e}")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Error deleting {self.item_type}: {e or type(e).__name__}")
             return False
 
-    async def get_item_size(self, item_id: int) -> int:
-        """Get the disk size of a series/movie in bytes."""
-        await self.setup_session()
-        endpoint = "series" if self.mode == "sonarr" else "movie"
-        url = f"{self.servarr_url}/api/v3/{endpoint}/{item_id}"
-        headers = {"X-Api-Key": self.servarr_api_key}
-
-        try:
-            async with self.session.get(url, headers=headers) as response:
-                response.raise_for_status()
-                item_data = await response.json()
-                if self.mode == "sonarr":
-                    return item_data.get("statistics", {}).get("sizeOnDisk", 0)
-                else:  # radarr
-                    return item_data.get("sizeOnDisk", 0)
-        except aiohttp.ClientError as e:
-            print(f"Error getting {self.item_type} size: {e}")
-            return 0
-
     async def get_items_by_size(self, limit: int = None) -> List[Dict[str, Any]]:
         """Get all series/movies sorted by disk size, optionally limited to top N."""
         items = await self.get_items()
@@ -156,40 +224,57 @@ class ServarrTautulliAnalyzer:
         for item in items:
             if self.mode == "sonarr":
                 item["sizeOnDisk"] = item.get("statistics", {}).get("sizeOnDisk", 0)
-            # radarr already has sizeOnDisk at top level
+            else:  # radarr has sizeOnDisk at top level
+                item["sizeOnDisk"] = item.get("sizeOnDisk", 0)
 
-        sorted_items = sorted(items, key=lambda x: x.get("sizeOnDisk", 0), reverse=True)
-        return sorted_items[:limit] if limit is not None else sorted_items
+        # Partial sort when only the top N are wanted: O(N log limit)
+        if limit is not None:
+            return heapq.nlargest(limit, items, key=itemgetter("sizeOnDisk"))
+        return sorted(items, key=itemgetter("sizeOnDisk"), reverse=True)
 
-    def get_plex_library_section_id(self, library_name: str) -> Optional[int]:
+    async def get_plex_library_section_id(self, library_name: str) -> Optional[int]:
         """Get the Plex library section ID for the given library name."""
+        await self.setup_session()
         url = f"{self.plex_url}/library/sections"
         headers = {"X-Plex-Token": self.plex_token}
 
         try:
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-
-            # Parse XML response
-            from xml.etree import ElementTree
-
-            root = ElementTree.fromstring(response.content)
-
-            for directory in root.findall(".//Directory"):
-                if directory.get("title") == library_name:
-                    return directory.get("key")
-
-            return None
-        except requests.exceptions.RequestException as e:
-            print(f"Error getting Plex library sections: {e}")
+            async with self._sem, self.session.get(url, headers=headers) as response:
+                response.raise_for_status()
+                body = await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Error getting Plex library sections: {e or type(e).__name__}")
             return None
 
+        root = ElementTree.fromstring(body)
+
+        # iter() filters by tag in C and stops at the first hit, unlike
+        # findall() which builds the full list of Directory elements first
+        return next(
+            (
+                directory.get("key")
+                for directory in root.iter("Directory")
+                if directory.get("title") == library_name
+            ),
+            None,
+        )
+
     async def setup_session(self):
-        """Set up the aiohttp session."""
+        """Set up the aiohttp session with a bounded, keep-alive connection pool."""
         if self.session is None:
+            connector = aiohttp.TCPConnector(
+                limit=20, limit_per_host=10, keepalive_timeout=30
+            )
             self.session = aiohttp.ClientSession(
-                headers={"Accept-Encoding": "gzip, deflate"}
+                connector=connector,
+                # Bound connecting and each read rather than the whole request,
+                # so a slow delete with deleteFiles=true is not cut off
+                timeout=aiohttp.ClientTimeout(
+                    total=None, sock_connect=30, sock_read=300
+                ),
+                headers={"Accept-Encoding": "gzip, deflate"},
             )
+            self._sem = asyncio.Semaphore(10)
 
     async def close_session(self):
         """Close the aiohttp session."""
@@ -215,15 +300,19 @@ class ServarrTautulliAnalyzer:
     async def get_tautulli_library_sections(self) -> List[Dict[str, Any]]:
         """
         Get all library sections from Tautulli.
+        Sections don't change during a run, so a successful lookup is cached.
         """
+        if self._libraries_cache is not None:
+            return self._libraries_cache
+
         try:
             await self.setup_session()
             url = f"{self.tautulli_url}/api/v2"
             params = {"apikey": self.tautulli_api_key, "cmd": "get_libraries"}
 
-            async with self.session.get(url, params=params) as response:
+            async with self._sem, self.session.get(url, params=params) as response:
                 response.raise_for_status()
-                data = await response.json()
+                data = _json_loads(await response.read())
 
                 self.debug_request(
                     "Get Tautulli Libraries", url, params, response.status, data
@@ -235,19 +324,23 @@ class ServarrTautulliAnalyzer:
                     )
                     return []
 
-                return data.get("response", {}).get("data", [])
+                self._libraries_cache = data.get("response", {}).get("data", [])
+                return self._libraries_cache
         except Exception as e:
             print(f"Error getting library sections from Tautulli: {e}")
             return []
 
     async def fetch_recently_watched(self, months: int = 2) -> set:
         """
-        Fetch all titles watched in the past N months from Tautulli in a single request.
-        Returns a set of lowercase titles.
+        Fetch all titles watched in the past N months from Tautulli, paging through history.
+        Returns a set of lowercase titles. Results are cached per months value
+        so repeated checks during a run don't hit Tautulli again.
         """
-        now = datetime.datetime.now()
+        if months in self._watched_cache:
+            return self._watched_cache[months]
+
         unix_timestamp = int(
-            time.mktime((now - datetime.timedelta(days=30 * months)).timetuple())
+            (datetime.datetime.now() - datetime.timedelta(days=30 * months)).timestamp()
         )
 
         library_sections = await self.get_tautulli_library_sections()
@@ -292,80 +385,151 @@ class ServarrTautulliAnalyzer:
             "apikey": self.tautulli_api_key,
             "cmd": "get_history",
             "section_id": section_id,
-            "length": 10000,
+            "include_activity": 0,
+            "start": 0,
+            "length": TAUTULLI_HISTORY_PAGE_SIZE,
             "order_column": "date",
             "order_dir": "desc",
             "after": unix_timestamp,
         }
+        title_key = "grandparent_title" if self.mode == "sonarr" else "title"
+
+        watched = set()
+        watch_counts = {}
+        # Play counts are only reported in verbose/debug output
+        count_plays = self.verbose or self.debug
+        # Page through the history newest first. Tautulli may not apply "after"
+        # to an epoch value, so also stop at the first row older than the cutoff,
+        # on a short page, or once every filtered record has been read
+        while True:
+            try:
+                async with self._sem, self.session.get(url, params=params) as response:
+                    response.raise_for_status()
+                    data = _json_loads(await response.read())
+                    status = response.status
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                print(f"Error fetching Tautulli watch history: {e or type(e).__name__}")
+                return set()
+
+            self.debug_request(
+                f"Get Tautulli History (after {datetime.datetime.fromtimestamp(unix_timestamp)}, "
+                f"start {params['start']})",
+                url,
+                params,
+                status,
+                data,
+            )
 
-        try:
-            async with self.session.get(url, params=params) as response:
-                response.raise_for_status()
-                data = await response.json()
-
-                self.debug_request(
-                    f"Get Tautulli History (after {datetime.datetime.fromtimestamp(unix_timestamp)})",
-                    url,
-                    params,
-                    response.status,
-                    data,
+            if data.get("response", {}).get("result") != "success":
+                print(
+                    f"Error getting history from Tautulli: "
+                    f"{data.get('response', {}).get('message')}"
                 )
-
-                if data.get("response", {}).get("result") != "success":
-                    print(
-                        f"Error getting history from Tautulli: "
-                        f"{data.get('response', {}).get('message')}"
-                    )
-                    return set()
-
-                watched = set()
-                watch_counts = {}
-                for item in data.get("response", {}).get("data", {}).get("data", []):
-                    title = (
-                        item.get("grandparent_title")
-                        if self.mode == "sonarr"
-                        else item.get("title")
-                    )
-                    if title:
-                        t = title.lower()
-                        watched.add(t)
+                return set()
+
+            history = data.get("response", {}).get("data", {})
+            rows = history.get("data", [])
+            reached_cutoff = False
+            for item in rows:
+                if item.get("date", unix_timestamp) < unix_timestamp:
+                    reached_cutoff = True
+                    break
+                title = item.get(title_key)
+                if title:
+                    t = title.lower()
+                    watched.add(t)
+                    if count_plays:
                         watch_counts[t] = watch_counts.get(t, 0) + 1
 
-                if self.verbose or self.debug:
-                    item_type_plural = "shows" if self.mode == "sonarr" else "movies"
-                    print(
-                        f"Found {len(watched)} {item_type_plural} watched in the past {months} months"
-                    )
-                    if watched:
-                        sorted_counts = sorted(
-                            watch_counts.items(), key=lambda x: x[1], reverse=True
-                        )
-                        print(f"Top 10 most watched {item_type_plural}:")
-                        for name, count in sorted_counts[:10]:
-                            print(f"  - '{name}': {count} plays")
-                        if self.debug:
-                            print(f"\nAll watched {item_type_plural}:")
-                            for name in sorted(watched):
-                                print(f"  - '{name}'")
-                        print()
-
-                return watched
-        except aiohttp.ClientError as e:
-            print(f"Error fetching Tautulli watch history: {e}")
-            return set()
+            params["start"] += len(rows)
+            total = history.get("recordsFiltered")
+            if (
+                reached_cutoff
+                or len(rows) < params["length"]
+                or (total is not None and params["start"] >= total)
+            ):
+                break
+
+        if self.verbose or self.debug:
+            item_type_plural = "shows" if self.mode == "sonarr" else "movies"
+            print(
+                f"Found {len(watched)} {item_type_plural} watched in the past {months} months"
+            )
+            if watched:
+                top = heapq.nlargest(10, watch_counts.items(), key=itemgetter(1))
+                print(f"Top 10 most watched {item_type_plural}:")
+                for name, count in top:
+                    print(f"  - '{name}': {count} plays")
+                if self.debug:
+                    print(f"\nAll watched {item_type_plural}:")
+                    for name in sorted(watched):
+                        print(f"  - '{name}'")
+                print()
+
+        self._watched_cache[months] = watched
+        return watched
+
+    @staticmethod
+    def _index_watched_titles(watched_titles: set) -> Tuple[Optional[Pattern], str]:
+        """
+        Build a substring index over the watched titles once per run.
+
+        Returns a compiled alternation of all titles (finds a watched title
+        inside a candidate) and a newline-joined blob of them (finds a
+        candidate inside a watched title), so both containment checks run as
+        a single C-level scan instead of a Python loop over every title.
+        """
+        if not watched_titles:
+            return None, ""
+        ordered = sorted(watched_titles, key=len, reverse=True)
+        pattern = re.compile("|".join(map(re.escape, ordered)))
+        return pattern, "\n".join(ordered)
+
+    def _title_was_watched(
+        self, item_title: str, title_lower: str, watched_titles: set
+    ) -> bool:
+        """
+        Check if item_title exactly matches, or is aliased to, a watched title.
 
-    def _title_was_watched(self, item_title: str, watched_titles: set) -> bool:
-        """Check if item_title matches any entry in the pre-fetched watched_titles set."""
-        t = item_title.lower()
-        if t in watched_titles:
+        title_lower is item_title already lowercased by the caller; watched titles are
+        lowercased once when history is fetched.
+        """
+        if title_lower in watched_titles:
             if self.verbose:
                 print(f"'{item_title}' was watched recently (exact match)")
             return True
-        for w in watched_titles:
-            if t in w or w in t:
+        for alias in self.title_aliases.get(title_lower, ()):
+            if alias in watched_titles:
                 if self.verbose:
-                    print(f"'{item_title}' was watched recently via match '{w}'")
+                    print(f"'{item_title}' was watched recently via alias '{alias}'")
                 return True
+        return False
+
+    def _title_matches_watched_substring(
+        self,
+        item_title: str,
+        title_lower: str,
+        watched_index: Tuple[Optional[Pattern], str],
+    ) -> bool:
+        """Check if item_title contains, or is contained in, any watched title."""
+        pattern, blob = watched_index
+        match = None
+        if pattern is not None:
+            found = pattern.search(title_lower)
+            if found:
+                match = found.group(0)
+            else:
+                pos = blob.find(title_lower)
+                if pos != -1:
+                    # Titles never contain newlines, so the hit lies within one entry
+                    start = blob.rfind("\n", 0, pos) + 1
+                    end = blob.find("\n", pos)
+                    match = blob[start:] if end == -1 else blob[start:end]
+
+        if match is not None:
+            if self.verbose:
+                print(f"'{item_title}' was watched recently via match '{match}'")
+            return True
         if self.verbose:
             print(f"No recent watches found for '{item_title}'")
         return False
@@ -389,9 +553,20 @@ class ServarrTautulliAnalyzer:
             self.fetch_recently_watched(months),
         )
 
+        titles_lower = [item["title"].lower() for item in top_items]
+        # Most titles resolve with a hash lookup; the substring index is only
+        # built once the first title falls through to fuzzy matching
+        watched_index = None
+
         unwatched_items = []
-        for idx, item in enumerate(top_items):
-            watched = self._title_was_watched(item["title"], watched_titles)
+        for idx, (item, title_lower) in enumerate(zip(top_items, titles_lower)):
+            watched = self._title_was_watched(item["title"], title_lower, watched_titles)
+            if not watched:
+                if watched_index is None:
+                    watched_index = self._index_watched_titles(watched_titles)
+                watched = self._title_matches_watched_substring(
+                    item["title"], title_lower, watched_index
+                )
             status = "watched" if watched else "NOT watched"
             print(f"[{idx + 1}/{len(top_items)}] {item['title']} — {status}")
             if not watched:
@@ -476,18 +651,16 @@ class ServarrTautulliAnalyzer:
             self.report_path, f"unwatched_{self.mode}_{timestamp}.json"
         )
 
-        with open(report_file, "w") as f:
-            json.dump(
-                {
-                    "report_date": datetime.datetime.now().isoformat(),
-                    "mode": self.mode,
-                    "unwatched_count": len(unwatched_items),
-                    "months_threshold": months,
-                    "unwatched_items": unwatched_items,
-                },
-                f,
-                indent=2,
-            )
+        _write_json(
+            report_file,
+            {
+                "report_date": datetime.datetime.now().isoformat(),
+                "mode": self.mode,
+                "unwatched_count": len(unwatched_items),
+                "months_threshold": months,
+                "unwatched_items": unwatched_items,
+            },
+        )
 
         # Generate HTML report
         html_report_file = os.path.join(
@@ -509,27 +682,22 @@ class ServarrTautulliAnalyzer:
     def generate_html_report(
         self, unwatched_items: List[Dict], file_path: str, months: int
     ) -> None:
-        """Generate an HTML report of unwatched series/movies."""
+        """Generate an HTML report of unwatched series/movies.
+
+        unwatched_items comes from get_unwatched_items and is already ordered
+        by size (descending), the same order the JSON report uses.
+        """
         total_size = sum(item["size"] for item in unwatched_items)
 
         item_type = "Series" if self.mode == "sonarr" else "Movies"
 
-        html = f"""<!DOCTYPE html>
+        header = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Unwatched {item_type} Report</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; }}
-        h1 {{ color: #333; }}
-        table {{ border-collapse: collapse; width: 100%; margin-top: 20px; }}
-        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-        th {{ background-color: #f2f2f2; }}
-        tr:nth-child(even) {{ background-color: #f9f9f9; }}
-        tr:hover {{ background-color: #f5f5f5; }}
-        .summary {{ margin-bottom: 20px; }}
-    </style>
+{HTML_REPORT_STYLE}
 </head>
 <body>
     <h1>Unwatched {item_type} Report</h1>
@@ -545,24 +713,25 @@ class ServarrTautulliAnalyzer:
             <th>Path</th>
         </tr>"""
 
-        # Sort by size (descending)
-        sorted_items = sorted(unwatched_items, key=lambda x: x["size"], reverse=True)
-
-        for item in sorted_items:
-            html += f"""
+        # Build rows into a list and join once rather than growing a string
+        parts = [header]
+        parts.extend(
+            f"""
         <tr>
-            <td>{item['title']}</td>
+            <td>{escape(item['title'])}</td>
             <td>{item['size_human']}</td>
-            <td>{item['path']}</td>
+            <td>{escape(item['path'])}</td>
         </tr>"""
-
-        html += """
+            for item in unwatched_items
+        )
+        parts.append(
+            """
     </table>
 </body>
 </html>"""
+        )
 
-        with open(file_path, "w") as f:
-            f.write(html)
+        _write_atomic(file_path, "".join(parts).encode("utf-8"))
 
     @staticmethod
     def human_readable_size(size_bytes: int) -> str:
@@ -571,12 +740,9 @@ class ServarrTautulliAnalyzer:
             return "0B"
 
         size_names = ("B", "KB", "MB", "GB", "TB", "PB")
-        i = 0
-        while size_bytes >= 1024 and i < len(size_names) - 1:
-            size_bytes /= 1024.0
-            i += 1
-
-        return f"{size_bytes:.2f} {size_names[i]}"
+        # Each unit is 2**10 of the previous, so the bit length picks the unit
+        i = min((int(size_bytes).bit_length() - 1) // 10, len(size_names) - 1)
+        return f"{size_bytes / (1 << (10 * i)):.2f} {size_names[i]}"
 
 
 async def main_async():
@@ -614,6 +780,10 @@ async def main_async():
     # parser.add_argument('--mode', choices=['sonarr', 'radarr'], default='sonarr', help='Select mode: sonarr for TV shows, radarr for movies')
 
     args = parser.parse_args()
+    if args.limit is not None and args.limit < 1:
+        parser.error("--limit must be at least 1")
+    if args.months < 1:
+        parser.error("--months must be at least 1")
 
     # Force sonarr mode since radarr is temporarily disabled
     analyzer = ServarrTautulliAnalyzer(
@@ -629,7 +799,9 @@ async def main_async():
 
 
 def main():
-    asyncio.run(main_async())
+    # uvloop.run only exists from uvloop 0.18; older releases use asyncio.run
+    run = getattr(uvloop, "run", asyncio.run)
+    run(main_async())
 
 
 if __name__ == "__main__":
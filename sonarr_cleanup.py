@@ -8,14 +8,101 @@ prompts you to delete series that haven't been watched recently.
 
 import os
 import sys
+import re
 import json
+import hashlib
 import time
+import unicodedata
+import heapq
+import sqlite3
 import datetime
 import asyncio
 import aiohttp
 import argparse
-from typing import Dict, List, Any, Optional
+from operator import itemgetter
+from typing import Callable, Dict, List, Any, Optional, Pattern, Tuple
+from collections import Counter
 from configparser import ConfigParser
+from functools import lru_cache
+from html import escape
+
+try:
+    import orjson  # Optional: faster JSON decoding and encoding
+except ImportError:
+    orjson = None
+
+# API responses are cached on disk under the report path between runs
+CACHE_FILE = ".api_cache.sqlite"
+SERIES_CACHE_TTL = 3600  # seconds, default for [cache] series_ttl
+HISTORY_CACHE_TTL = 900  # seconds, default for [cache] history_ttl
+LIBRARIES_CACHE_TTL = 86400  # seconds, default for [cache] libraries_ttl
+# The history cutoff is rounded down to this step so nearby reruns send the
+# same requests; fixed so the cache settings never widen the watch window
+HISTORY_CUTOFF_STEP = 900  # seconds
+
+# Rows requested per Tautulli get_history page
+HISTORY_PAGE_SIZE = 500
+
+# Retry policy for idempotent GET requests
+MAX_ATTEMPTS = 5
+RETRY_BASE_DELAY = 0.1  # seconds, doubled after each failed attempt
+MAX_RETRY_AFTER = 60  # never wait longer than this on a Retry-After header
+
+# Words used to bucket watched titles for substring matching
+PUNCT_RE = re.compile(r"[\W_]+")
+
+HTML_REPORT_STYLE = """    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        h1 { color: #333; }
+        table { border-collapse: collapse; width: 100%; margin-top: 20px; }
+        th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+        th { background-color: #f2f2f2; }
+        tr:nth-child(even) { background-color: #f9f9f9; }
+        tr:hover { background-color: #f5f5f5; }
+        .summary { margin-bottom: 20px; }
+    </style>"""
+
+
+def _json_loads(body: bytes) -> Any:
+    """Decode a JSON response body, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+@lru_cache(maxsize=8)
+def _load_config(path: str, mtime: float) -> ConfigParser:
+    """
+    Parse the INI file at path; mtime is part of the cache key so edits are re-read.
+    The parser is shared between callers, so only read values from it.
+    """
+    config = ConfigParser()
+    config.read(path)
+    return config
+
+
+@lru_cache(maxsize=None)
+def _normalize_title(title: str) -> str:
+    """Casefold a title and strip accents so "Pokémon" and "Pokemon" compare equal."""
+    decomposed = unicodedata.normalize("NFKD", title)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """Write data beside path and rename it into place so a crash never leaves a partial file."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _write_json(path: str, payload: Any) -> None:
+    """Write payload to path as indented JSON, preferring orjson when installed."""
+    if orjson is not None:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(payload, indent=2).encode("utf-8")
+    _write_atomic(path, data)
 
 
 class SonarrCleanup:
@@ -24,38 +111,97 @@ class SonarrCleanup:
         config_file: str,
         verbose: bool = False,
         debug: bool = False,
+        use_cache: bool = True,
     ):
         self.verbose = verbose
         self.debug = debug
+        self.use_cache = use_cache
         self.session = None
+        self._sem = None
+        self._cache_db: Optional[sqlite3.Connection] = None
+        self._watched_shows: Dict[int, set] = {}  # months -> watched titles
 
         if not os.path.exists(config_file):
             print(f"Error: Config file {config_file} not found.")
             sys.exit(1)
 
-        config = ConfigParser()
-        config.read(config_file)
+        config = _load_config(config_file, os.path.getmtime(config_file))
 
-        self.sonarr_url = config.get("sonarr", "url")
+        self.sonarr_url = config.get("sonarr", "url").rstrip("/")
         self.sonarr_api_key = config.get("sonarr", "api_key")
-        self.tautulli_url = config.get("tautulli", "url")
+        self.tautulli_url = config.get("tautulli", "url").rstrip("/")
         self.tautulli_api_key = config.get("tautulli", "api_key")
         self.tautulli_library_name = config.get(
             "tautulli", "tv_library_name", fallback="TV Shows"
         )
         self.report_path = config.get("report", "path", fallback="./reports")
         os.makedirs(self.report_path, exist_ok=True)
+        self.series_cache_ttl = config.getint(
+            "cache", "series_ttl", fallback=SERIES_CACHE_TTL
+        )
+        self.history_cache_ttl = config.getint(
+            "cache", "history_ttl", fallback=HISTORY_CACHE_TTL
+        )
+        self.libraries_cache_ttl = config.getint(
+            "cache", "libraries_ttl", fallback=LIBRARIES_CACHE_TTL
+        )
+
+        # Endpoints used on every call, built once
+        self.series_url = f"{self.sonarr_url}/api/v3/series"
+        self.tautulli_api_url = f"{self.tautulli_url}/api/v2"
 
     async def setup_session(self):
         if self.session is None:
+            # One pooled session for Sonarr and Tautulli; keep idle connections
+            # open between calls so follow-up requests skip the TCP handshake
+            connector = aiohttp.TCPConnector(
+                limit=64, limit_per_host=16, keepalive_timeout=30, ttl_dns_cache=300
+            )
             self.session = aiohttp.ClientSession(
-                headers={"Accept-Encoding": "gzip, deflate"}
+                connector=connector,
+                headers={"Accept-Encoding": "gzip, deflate"},
             )
+            # Caps in-flight requests across every call that uses the session
+            self._sem = asyncio.Semaphore(32)
 
     async def close_session(self):
         if self.session is not None:
             await self.session.close()
             self.session = None
+        if self._cache_db is not None:
+            self._cache_db.close()
+            self._cache_db = None
+
+    def _cache(self) -> sqlite3.Connection:
+        if self._cache_db is None:
+            self._cache_db = sqlite3.connect(os.path.join(self.report_path, CACHE_FILE))
+            self._cache_db.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, fetched_at REAL NOT NULL, body BLOB NOT NULL)"
+            )
+        return self._cache_db
+
+    def _cache_get(self, key: str, ttl: int) -> Optional[bytes]:
+        """Return a cached response body younger than ttl seconds, if any."""
+        if not self.use_cache:
+            return None
+        row = self._cache().execute(
+            "SELECT fetched_at, body FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None or time.time() - row[0] > ttl:
+            return None
+        return row[1]
+
+    def _cache_set(self, key: str, body: bytes) -> None:
+        with self._cache():
+            self._cache().execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                (key, time.time(), body),
+            )
+
+    def _cache_invalidate(self, key: str) -> None:
+        with self._cache():
+            self._cache().execute("DELETE FROM responses WHERE key = ?", (key,))
 
     def _debug(self, name: str, url: str, params: dict, status: int, data: Any):
         if not self.debug:
@@ -70,31 +216,100 @@ class SonarrCleanup:
             print(f"Response (text): {str(data)[:500]}...")
         print("==== END DEBUG ====\n")
 
-    async def get_series(self) -> List[Dict[str, Any]]:
-        """Fetch all series from Sonarr."""
+    @staticmethod
+    def _cache_key(url: str, params: Optional[dict] = None) -> str:
+        query = sorted((params or {}).items())
+        return hashlib.sha256(f"{url}?{query}".encode()).hexdigest()
+
+    async def _get(self, url: str, **kwargs) -> Tuple[int, bytes]:
+        """
+        GET url and return (status, body), retrying with exponential backoff on
+        connection errors and 429/5xx responses. Retry-After is honored when sent.
+        """
         await self.setup_session()
-        url = f"{self.sonarr_url}/api/v3/series"
+        for attempt in range(MAX_ATTEMPTS):
+            last_attempt = attempt == MAX_ATTEMPTS - 1
+            delay = RETRY_BASE_DELAY * 2 ** attempt
+            try:
+                async with self._sem, self.session.get(url, **kwargs) as response:
+                    if response.status != 429 and response.status < 500:
+                        response.raise_for_status()
+                        return response.status, await response.read()
+                    if last_attempt:
+                        response.raise_for_status()
+                    retry_after = response.headers.get("Retry-After", "")
+                    if retry_after.isdigit():
+                        delay = max(delay, min(int(retry_after), MAX_RETRY_AFTER))
+            except aiohttp.ClientConnectionError:
+                if last_attempt:
+                    raise
+            if self.verbose:
+                print(f"Retrying {url} in {delay:.1f}s...")
+            await asyncio.sleep(delay)
+
+    async def _get_json(
+        self, url: str, ttl: int, is_valid: Callable[[Any], bool], **kwargs
+    ) -> Tuple[int, Any]:
+        """
+        GET url and decode its JSON body, reusing a stored response younger than
+        ttl seconds. Only payloads accepted by is_valid are stored or reused, so
+        an error reply is never replayed from the cache.
+        """
+        key = self._cache_key(url, kwargs.get("params"))
+        cached = self._cache_get(key, ttl)
+        if cached is not None:
+            data = _json_loads(cached)
+            if is_valid(data):
+                if self.verbose:
+                    print(f"Using cached response for {url}")
+                return 200, data
+
+        status, body = await self._get(url, **kwargs)
+        data = _json_loads(body)
+        if is_valid(data):
+            self._cache_set(key, body)
+        return status, data
+
+    @staticmethod
+    def _tautulli_succeeded(data: Any) -> bool:
+        if not isinstance(data, dict):
+            return False
+        return data.get("response", {}).get("result") == "success"
+
+    @classmethod
+    def _has_show_library(cls, data: Any) -> bool:
+        if not cls._tautulli_succeeded(data):
+            return False
+        sections = data["response"].get("data") or []
+        return any(s.get("section_type") == "show" for s in sections)
+
+    async def get_series(self) -> List[Dict[str, Any]]:
+        """Fetch all series from Sonarr, reusing a recent on-disk copy if present."""
         try:
-            async with self.session.get(
-                url, headers={"X-Api-Key": self.sonarr_api_key}
-            ) as response:
-                response.raise_for_status()
-                return await response.json()
+            _, series = await self._get_json(
+                self.series_url,
+                self.series_cache_ttl,
+                lambda data: isinstance(data, list),
+                headers={"X-Api-Key": self.sonarr_api_key},
+            )
         except aiohttp.ClientError as e:
             print(f"Error connecting to Sonarr: {e}")
             sys.exit(1)
+        return series
 
     async def delete_series(self, series_id: int) -> bool:
         """Delete a series and its files from Sonarr."""
         await self.setup_session()
-        url = f"{self.sonarr_url}/api/v3/series/{series_id}"
+        url = f"{self.series_url}/{series_id}"
         try:
-            async with self.session.delete(
+            async with self._sem, self.session.delete(
                 url,
                 headers={"X-Api-Key": self.sonarr_api_key},
                 params={"deleteFiles": "true"},
             ) as response:
                 if response.status == 200:
+                    # The cached series list still contains the deleted show
+                    self._cache_invalidate(self._cache_key(self.series_url))
                     return True
                 print(f"Error deleting series: HTTP {response.status}")
                 return False
@@ -106,35 +321,38 @@ class SonarrCleanup:
         """Return all series sorted by disk size descending, optionally capped at limit."""
         series = await self.get_series()
         for s in series:
-            s["sizeOnDisk"] = s.get("statistics", {}).get("sizeOnDisk", 0)
-        sorted_series = sorted(series, key=lambda x: x["sizeOnDisk"], reverse=True)
-        return sorted_series[:limit] if limit is not None else sorted_series
+            s["sizeOnDisk"] = (s.get("statistics") or {}).get("sizeOnDisk", 0)
+        if limit is not None:
+            return heapq.nlargest(limit, series, key=itemgetter("sizeOnDisk"))
+        return sorted(series, key=itemgetter("sizeOnDisk"), reverse=True)
 
     async def fetch_recently_watched(self, months: int = 2) -> set:
         """
         Fetch all show titles watched in the past N months from Tautulli.
-        Returns a set of lowercase titles.
+        Returns a set of normalised titles, cached per months value for the run.
         """
-        await self.setup_session()
+        if months in self._watched_shows:
+            return self._watched_shows[months]
+
         unix_timestamp = int(
-            time.mktime(
-                (
-                    datetime.datetime.now() - datetime.timedelta(days=30 * months)
-                ).timetuple()
-            )
+            (datetime.datetime.now() - datetime.timedelta(days=30 * months)).timestamp()
         )
+        unix_timestamp -= unix_timestamp % HISTORY_CUTOFF_STEP
 
         # Get library sections
         try:
-            async with self.session.get(
-                f"{self.tautulli_url}/api/v2",
+            _, data = await self._get_json(
+                self.tautulli_api_url,
+                self.libraries_cache_ttl,
+                self._has_show_library,
                 params={"apikey": self.tautulli_api_key, "cmd": "get_libraries"},
-            ) as response:
-                response.raise_for_status()
-                data = await response.json()
+            )
         except Exception as e:
             print(f"Error getting Tautulli libraries: {e}")
             return set()
+        if not self._tautulli_succeeded(data):
+            print(f"Tautulli error: {data.get('response', {}).get('message')}")
+            return set()
 
         sections = data.get("response", {}).get("data", [])
         target_section = next(
@@ -164,71 +382,130 @@ class SonarrCleanup:
                 f"Using Tautulli library: {target_section['section_name']} (ID: {section_id})"
             )
 
-        # Fetch history
+        # Fetch history a page at a time; rows come newest first, so stop on a
+        # short page or once a row falls before the cutoff
         params = {
             "apikey": self.tautulli_api_key,
             "cmd": "get_history",
             "section_id": section_id,
-            "length": 10000,
+            "start": 0,
+            "length": HISTORY_PAGE_SIZE,
             "order_column": "date",
             "order_dir": "desc",
             "after": unix_timestamp,
+            "include_activity": 0,  # skip merging in-progress sessions into each page
         }
-        try:
-            async with self.session.get(
-                f"{self.tautulli_url}/api/v2", params=params
-            ) as response:
-                response.raise_for_status()
-                data = await response.json()
-                self._debug(
-                    f"Tautulli history after {datetime.datetime.fromtimestamp(unix_timestamp)}",
-                    f"{self.tautulli_url}/api/v2",
-                    params,
-                    response.status,
-                    data,
+        watch_counts: Counter = Counter()
+        while True:
+            try:
+                status, data = await self._get_json(
+                    self.tautulli_api_url,
+                    self.history_cache_ttl,
+                    self._tautulli_succeeded,
+                    params=params,
                 )
-        except aiohttp.ClientError as e:
-            print(f"Error fetching Tautulli watch history: {e}")
-            return set()
+            except aiohttp.ClientError as e:
+                print(f"Error fetching Tautulli watch history: {e}")
+                return set()
+            self._debug(
+                f"Tautulli history after {datetime.datetime.fromtimestamp(unix_timestamp)}"
+                f" (start {params['start']})",
+                self.tautulli_api_url,
+                params,
+                status,
+                data,
+            )
 
-        if data.get("response", {}).get("result") != "success":
-            print(f"Tautulli error: {data.get('response', {}).get('message')}")
-            return set()
+            if not self._tautulli_succeeded(data):
+                print(f"Tautulli error: {data.get('response', {}).get('message')}")
+                return set()
 
-        watched = set()
-        watch_counts: Dict[str, int] = {}
-        for item in data.get("response", {}).get("data", {}).get("data", []):
-            title = item.get("grandparent_title")
-            if title:
-                t = title.lower()
-                watched.add(t)
-                watch_counts[t] = watch_counts.get(t, 0) + 1
+            rows = data.get("response", {}).get("data", {}).get("data", [])
+            reached_cutoff = False
+            titles = []
+            for item in rows:
+                if item.get("date", unix_timestamp) < unix_timestamp:
+                    reached_cutoff = True
+                    break
+                title = item.get("grandparent_title")
+                if title:
+                    titles.append(_normalize_title(title))
+            watch_counts.update(titles)
+
+            if reached_cutoff or len(rows) < HISTORY_PAGE_SIZE:
+                break
+            params["start"] += len(rows)
 
+        watched = set(watch_counts)
         if self.verbose or self.debug:
             print(f"Found {len(watched)} shows watched in the past {months} months")
             if watched:
-                top = sorted(watch_counts.items(), key=lambda x: x[1], reverse=True)
                 print("Top 10 most watched:")
-                for name, count in top[:10]:
+                for name, count in watch_counts.most_common(10):
                     print(f"  - '{name}': {count} plays")
                 if self.debug:
                     for name in sorted(watched):
                         print(f"  - '{name}'")
             print()
 
+        self._watched_shows[months] = watched
         return watched
 
-    def _was_watched(self, title: str, watched: set) -> bool:
-        t = title.lower()
+    @staticmethod
+    def _join_watched(watched: set) -> str:
+        """Join the watched titles with newlines so one find() checks them all."""
+        return "\n".join(watched)
+
+    @staticmethod
+    def _compile_watched(watched: set) -> Optional[Pattern]:
+        """Compile one alternation finding any watched title inside a series title."""
+        if not watched:
+            return None
+        # Longest first so the reported match is the most specific title
+        ordered = sorted(watched, key=len, reverse=True)
+        return re.compile("|".join(map(re.escape, ordered)))
+
+    @staticmethod
+    def _index_by_key(watched: set) -> Dict[str, str]:
+        """Map each watched title, stripped to letters and digits, to the title."""
+        keys = ((PUNCT_RE.sub("", w), w) for w in watched)
+        return {k: w for k, w in keys if k}
+
+    def _was_watched(
+        self,
+        title: str,
+        watched: set,
+        key_index: Dict[str, str],
+        watched_blob: str,
+        watched_re: Optional[Pattern],
+    ) -> bool:
+        t = _normalize_title(title)
         if t in watched:
             if self.verbose:
                 print(f"'{title}' watched (exact match)")
             return True
-        for w in watched:
-            if t in w or w in t:
-                if self.verbose:
-                    print(f"'{title}' watched via match '{w}'")
-                return True
+        # Catches titles differing only in punctuation or spacing, e.g.
+        # "Agents of S.H.I.E.L.D." and "Agents of SHIELD"
+        key = PUNCT_RE.sub("", t)
+        if key in key_index:
+            if self.verbose:
+                print(f"'{title}' watched via match '{key_index[key]}'")
+            return True
+        match = watched_re.search(t) if watched_re is not None else None
+        if match:
+            if self.verbose:
+                print(f"'{title}' watched via match '{match.group()}'")
+            return True
+        # One C-level scan for this title inside any watched title; titles
+        # never contain newlines, so a hit lies within a single entry
+        pos = watched_blob.find(t) if watched_blob else -1
+        if pos != -1:
+            if self.verbose:
+                start = watched_blob.rfind("\n", 0, pos) + 1
+                end = watched_blob.find("\n", pos)
+                w = watched_blob[start:] if end == -1 else watched_blob[start:end]
+                print(f"'{title}' watched via match '{w}'")
+            return True
         if self.verbose:
             print(f"'{title}' NOT watched")
         return False
@@ -245,9 +522,15 @@ class SonarrCleanup:
             self.fetch_recently_watched(months),
         )
 
+        key_index = self._index_by_key(watched)
+        watched_blob = self._join_watched(watched)
+        watched_re = self._compile_watched(watched)
+
         unwatched = []
         for idx, s in enumerate(series_list):
-            was_watched = self._was_watched(s["title"], watched)
+            was_watched = self._was_watched(
+                s["title"], watched, key_index, watched_blob, watched_re
+            )
             status = "watched" if was_watched else "NOT watched"
             print(f"[{idx + 1}/{len(series_list)}] {s['title']} — {status}")
             if not was_watched:
@@ -316,60 +599,49 @@ class SonarrCleanup:
     async def generate_report(self, limit: int = None, months: int = 2) -> None:
         """Write JSON and HTML reports without prompting for deletion."""
         unwatched = await self.get_unwatched(limit, months)
+        total_size = sum(s["size"] for s in unwatched)
         timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
 
         json_path = os.path.join(self.report_path, f"unwatched_sonarr_{timestamp}.json")
-        with open(json_path, "w") as f:
-            json.dump(
-                {
-                    "report_date": datetime.datetime.now().isoformat(),
-                    "unwatched_count": len(unwatched),
-                    "months_threshold": months,
-                    "unwatched_series": unwatched,
-                },
-                f,
-                indent=2,
-            )
+        _write_json(
+            json_path,
+            {
+                "report_date": datetime.datetime.now().isoformat(),
+                "unwatched_count": len(unwatched),
+                "months_threshold": months,
+                "unwatched_series": unwatched,
+            },
+        )
 
         html_path = os.path.join(self.report_path, f"unwatched_sonarr_{timestamp}.html")
-        self._write_html_report(unwatched, html_path, months)
+        self._write_html_report(unwatched, html_path, months, total_size)
 
         print(f"\nReport generated:")
         print(f"  JSON: {json_path}")
         print(f"  HTML: {html_path}")
         print(f"\n{len(unwatched)} series not watched in {months} months.")
-        print(
-            f"Total reclaimable: {self.human_readable_size(sum(s['size'] for s in unwatched))}"
-        )
+        print(f"Total reclaimable: {self.human_readable_size(total_size)}")
 
-    def _write_html_report(self, unwatched: List[Dict], path: str, months: int) -> None:
-        total_size = self.human_readable_size(sum(s["size"] for s in unwatched))
+    def _write_html_report(
+        self, unwatched: List[Dict], path: str, months: int, total_size: int
+    ) -> None:
         rows = "\n".join(
-            f"        <tr><td>{s['title']}</td><td>{s['size_human']}</td><td>{s['path']}</td></tr>"
-            for s in sorted(unwatched, key=lambda x: x["size"], reverse=True)
+            f"        <tr><td>{escape(s['title'])}</td><td>{s['size_human']}</td><td>{escape(s['path'])}</td></tr>"
+            for s in unwatched  # already ordered by size from get_unwatched
         )
         html = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <title>Unwatched Series Report</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; }}
-        h1 {{ color: #333; }}
-        table {{ border-collapse: collapse; width: 100%; margin-top: 20px; }}
-        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-        th {{ background-color: #f2f2f2; }}
-        tr:nth-child(even) {{ background-color: #f9f9f9; }}
-        tr:hover {{ background-color: #f5f5f5; }}
-        .summary {{ margin-bottom: 20px; }}
-    </style>
+{HTML_REPORT_STYLE}
 </head>
 <body>
     <h1>Unwatched Series Report</h1>
     <div class="summary">
         <p>Generated: {datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>
         <p><strong>{len(unwatched)}</strong> series not watched in <strong>{months}</strong> months.</p>
-        <p>Reclaimable space: <strong>{total_size}</strong></p>
+        <p>Reclaimable space: <strong>{self.human_readable_size(total_size)}</strong></p>
     </div>
     <table>
         <tr><th>Title</th><th>Size</th><th>Path</th></tr>
@@ -377,19 +649,15 @@ class SonarrCleanup:
     </table>
 </body>
 </html>"""
-        with open(path, "w") as f:
-            f.write(html)
+        _write_atomic(path, html.encode("utf-8"))
 
     @staticmethod
     def human_readable_size(size_bytes: int) -> str:
         if size_bytes == 0:
             return "0B"
         size_names = ("B", "KB", "MB", "GB", "TB", "PB")
-        i = 0
-        while size_bytes >= 1024 and i < len(size_names) - 1:
-            size_bytes /= 1024.0
-            i += 1
-        return f"{size_bytes:.2f} {size_names[i]}"
+        i = min((int(size_bytes).bit_length() - 1) // 10, len(size_names) - 1)
+        return f"{size_bytes / (1 << (10 * i)):.2f} {size_names[i]}"
 
 
 async def main_async():
@@ -402,9 +670,16 @@ async def main_async():
     parser.add_argument("-v", "--verbose", action="store_true", help="Show match details")
     parser.add_argument("-d", "--debug", action="store_true", help="Print full API responses")
     parser.add_argument("--report-only", action="store_true", help="Write JSON/HTML report without deletion prompt")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore cached API responses and fetch fresh data")
     args = parser.parse_args()
+    if args.limit is not None and args.limit < 1:
+        parser.error("--limit must be at least 1")
+    if args.months < 1:
+        parser.error("--months must be at least 1")
 
-    cleanup = SonarrCleanup(args.config, verbose=args.verbose, debug=args.debug)
+    cleanup = SonarrCleanup(
+        args.config, verbose=args.verbose, debug=args.debug, use_cache=not args.no_cache
+    )
     try:
         if args.report_only:
             await cleanup.generate_report(args.limit, args.months)